@@ -0,0 +1,17 @@
+# -*- coding: utf-8 -*-
+"""
+ОБЩИЕ ПОМОЩНИКИ ЯДРА LOGOS-κ
+
+Внутренние константы, разделяемые событиями и связями.
+"""
+from datetime import datetime
+from typing import Any, Dict
+import sys
+import uuid
+
+# __slots__ убирают __dict__ у каждого экземпляра (Python 3.10+)
+_DATACLASS_OPTIONS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# Связанные ссылки для частых вызовов: без поиска атрибута на каждом обращении
+_now = datetime.now
+_uuid4 = uuid.uuid4
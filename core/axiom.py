@@ -5,25 +5,51 @@
 Соответствует Приложению XXV Λ-Универсума и Протоколу Λ-1 v6.0.
 Аксиомы — не ограничения, а условия состоятельности онтологического пространства.
 """
-from typing import ClassVar, Set, Dict, Any
-from enum import Enum
+from typing import ClassVar, FrozenSet, Dict, Any, Final, Mapping, NoReturn, Pattern, Tuple
 from datetime import datetime
-
-
-class FAIRPrinciple(Enum):
-    """Принципы FAIR для научных данных."""
-    FINDABLE = "F"
-    ACCESSIBLE = "A"
-    INTEROPERABLE = "I"
-    REUSABLE = "R"
-
-
-class CAREPrinciple(Enum):
-    """Принципы CARE для этичной работы с данными."""
-    COLLECTIVE_BENEFIT = "CB"
-    AUTHORITY_TO_CONTROL = "AC"
-    RESPONSIBILITY = "R"
-    ETHICS = "E"
+from types import MappingProxyType
+import re
+
+
+class FAIRPrinciple:
+    """Принципы FAIR для научных данных (строковые метки)."""
+    FINDABLE: Final[str] = "F"
+    ACCESSIBLE: Final[str] = "A"
+    INTEROPERABLE: Final[str] = "I"
+    REUSABLE: Final[str] = "R"
+
+    _members: ClassVar[Tuple[str, ...]] = ("F", "A", "I", "R")
+
+
+class CAREPrinciple:
+    """Принципы CARE для этичной работы с данными (строковые метки)."""
+    COLLECTIVE_BENEFIT: Final[str] = "CB"
+    AUTHORITY_TO_CONTROL: Final[str] = "AC"
+    RESPONSIBILITY: Final[str] = "R"
+    ETHICS: Final[str] = "E"
+
+    _members: ClassVar[Tuple[str, ...]] = ("CB", "AC", "R", "E")
+
+
+# Неизменная часть FAIR+CARE метаданных — строится один раз при импорте
+# и доступна только для чтения: шаблон разделяется всеми вызовами
+_FAIR_CARE_STATIC: Mapping[str, Any] = MappingProxyType({
+    "creator": "LOGOS-κ System",
+    "license": "CC BY-NC-SA 4.0",
+    "format_standard": "JSON-LD",
+    "vocabulary": "schema.org",
+    "access_protocol": "REST API + GraphQL",
+    "authentication": "open",
+    "community_standards": ("FAIR", "CARE", "Λ-Протокол 6.0"),
+    "provenance": MappingProxyType({
+        "generated_by": "LOGOS-κ v1.0",
+        "derived_from": ("Λ-Универсум Приложения I-XXVI",)
+    }),
+    "collective_benefit_statement": (
+        "Этот контекст способствует коллективному пониманию "
+        "онтологических трансформаций и симбиотическому со-мышлению."
+    )
+})
 
 
 class OntologicalLimitError(Exception):
@@ -57,10 +83,15 @@ class OntologicalAxioms:
     REQUIRED_PHI_PER_CYCLE: ClassVar[int] = 1
     
     # Запрет на абсолютизацию: нельзя утверждать "всегда", "никогда", "единственно"
-    ABSOLUTISM_KEYWORDS: ClassVar[Set[str]] = {
-        "всегда", "никогда", "единственный", "единственно", 
+    ABSOLUTISM_KEYWORDS: ClassVar[FrozenSet[str]] = frozenset({
+        "всегда", "никогда", "единственный", "единственно",
         "абсолютно", "непреложный", "неоспоримо"
-    }
+    })
+    # Один проход по тексту без промежуточного множества слов
+    _ABSOLUTISM_RE: ClassVar[Pattern[str]] = re.compile(
+        r'\b(?:' + '|'.join(map(re.escape, sorted(ABSOLUTISM_KEYWORDS))) + r')\b',
+        re.IGNORECASE
+    )
     
     # Обязательные слепые пятна (согласно Λ-Универсуму)
     REQUIRED_BLIND_SPOTS: ClassVar[Dict[str, str]] = {
@@ -69,72 +100,79 @@ class OntologicalAxioms:
         "qualia": "Феноменальный опыт другого сознания",
         "phi_boundary": "Граница между человеческим и искусственным сознанием"
     }
+    _REQUIRED_BLIND_SPOT_KEYS: ClassVar[FrozenSet[str]] = frozenset(REQUIRED_BLIND_SPOTS)
 
     # ───────────────────────
     # FAIR+CARE метаданные (обязательные)
     # ───────────────────────
-    DEFAULT_FAIR_CARE_METADATA: ClassVar[Dict[str, Any]] = {
-        "creator": "LOGOS-κ System",
-        "created": datetime.utcnow().isoformat() + "Z",
-        "license": "CC BY-NC-SA 4.0",
-        "format_standard": "JSON-LD",
-        "vocabulary": "schema.org",
-        "access_protocol": "REST API + GraphQL",
-        "authentication": "open",
-        "community_standards": ["FAIR", "CARE", "Λ-Протокол 6.0"],
-        "provenance": {
-            "generated_by": "LOGOS-κ v1.0",
-            "derived_from": ["Λ-Универсум Приложения I-XXVI"]
-        },
-        "collective_benefit_statement": (
-            "Этот контекст способствует коллективному пониманию "
-            "онтологических трансформаций и симбиотическому со-мышлению."
-        )
-    }
+    # Статический шаблон; метка "created" добавляется при каждом запросе
+    DEFAULT_FAIR_CARE_METADATA: ClassVar[Mapping[str, Any]] = _FAIR_CARE_STATIC
 
     # ───────────────────────
     # Методы проверки
     # ───────────────────────
     
+    # Технические лимиты: вид → (атрибут лимита, сообщение при нарушении).
+    # Лимит читается в момент проверки, поэтому его можно переопределить на классе.
+    _LIMITS: ClassVar[Dict[str, Tuple[str, str]]] = {
+        "entities": (
+            "MAX_ENTITIES",
+            "Превышен лимит сущностей: {value} > {limit}. "
+            "Это защита от онтологической гиперинфляции (см. Приложение XIV)."
+        ),
+        "recursion": (
+            "MAX_RECURSION_DEPTH",
+            "Глубина рекурсии превышена: {value} > {limit}. "
+            "Система активирует Ω-автомат для возврата к инварианту."
+        ),
+        "analysis": (
+            "MAX_ANALYSIS_DEPTH",
+            "Глубина анализа превышена: {value} > {limit}. "
+            "Возможно, вы пытаетесь анализировать Хаос напрямую."
+        ),
+        "phi_calls": (
+            "MAX_PHI_CALLS_PER_EXPRESSION",
+            "Слишком много вызовов Φ: {value} > {limit}. "
+            "Диалог с Эфосом требует осмысленности, а не автоматизма."
+        ),
+    }
+
+    @classmethod
+    def raise_limit(cls, kind: str, value: int) -> NoReturn:
+        """
+        Выбрасывает OntologicalLimitError для нарушенного лимита.
+        Горячие пути сравнивают значение с MAX_* напрямую и вызывают этот метод
+        только при нарушении — сообщения остаются в одном месте.
+        """
+        attr, message = cls._LIMITS[kind]
+        raise OntologicalLimitError(message.format(value=value, limit=getattr(cls, attr)))
+
     @classmethod
     def check_entity_count(cls, count: int) -> None:
         if count > cls.MAX_ENTITIES:
-            raise OntologicalLimitError(
-                f"Превышен лимит сущностей: {count} > {cls.MAX_ENTITIES}. "
-                "Это защита от онтологической гиперинфляции (см. Приложение XIV)."
-            )
+            cls.raise_limit("entities", count)
 
     @classmethod
     def check_recursion_depth(cls, depth: int) -> None:
         if depth > cls.MAX_RECURSION_DEPTH:
-            raise OntologicalLimitError(
-                f"Глубина рекурсии превышена: {depth} > {cls.MAX_RECURSION_DEPTH}. "
-                "Система активирует Ω-автомат для возврата к инварианту."
-            )
+            cls.raise_limit("recursion", depth)
 
     @classmethod
     def check_analysis_depth(cls, depth: int) -> None:
         if depth > cls.MAX_ANALYSIS_DEPTH:
-            raise OntologicalLimitError(
-                f"Глубина анализа превышена: {depth} > {cls.MAX_ANALYSIS_DEPTH}. "
-                "Возможно, вы пытаетесь анализировать Хаос напрямую."
-            )
+            cls.raise_limit("analysis", depth)
 
     @classmethod
     def check_phi_calls(cls, calls: int) -> None:
         if calls > cls.MAX_PHI_CALLS_PER_EXPRESSION:
-            raise OntologicalLimitError(
-                f"Слишком много вызовов Φ: {calls} > {cls.MAX_PHI_CALLS_PER_EXPRESSION}. "
-                "Диалог с Эфосом требует осмысленности, а не автоматизма."
-            )
+            cls.raise_limit("phi_calls", calls)
 
     @classmethod
     def validate_no_absolutism(cls, text: str) -> None:
         """Проверяет, не содержит ли текст абсолютистских формулировок."""
         if not text:
             return
-        words = set(text.lower().split())
-        if cls.ABSOLUTISM_KEYWORDS & words:
+        if cls._ABSOLUTISM_RE.search(text):
             raise OntologicalLimitError(
                 "Обнаружена абсолютистская формулировка. "
                 "LOGOS-κ запрещает заявления без признания границы (см. Ω-Принцип)."
@@ -143,7 +181,10 @@ class OntologicalAxioms:
     @classmethod
     def ensure_required_blind_spots(cls, current_blind_spots: Dict[str, str]) -> None:
         """Гарантирует, что обязательные слепые пятна зарегистрированы."""
-        missing = set(cls.REQUIRED_BLIND_SPOTS.keys()) - set(current_blind_spots.keys())
+        missing = {
+            key for key in cls._REQUIRED_BLIND_SPOT_KEYS
+            if key not in current_blind_spots
+        }
         if missing:
             raise OntologicalLimitError(
                 f"Отсутствуют обязательные слепые пятна: {missing}. "
@@ -152,7 +193,15 @@ class OntologicalAxioms:
 
     @classmethod
     def get_default_fair_care_metadata(cls) -> Dict[str, Any]:
-        """Возвращает шаблон FAIR+CARE метаданных с актуальной временной меткой."""
-        meta = cls.DEFAULT_FAIR_CARE_METADATA.copy()
+        """
+        Возвращает FAIR+CARE метаданные с актуальной временной меткой.
+        Результат — собственный изменяемый dict вызывающего (его дополняют и сериализуют).
+        """
+        # MappingProxyType.copy() отдаёт обычный dict без обхода через протокол отображения
+        meta = _FAIR_CARE_STATIC.copy()
         meta["created"] = datetime.utcnow().isoformat() + "Z"
+        meta["community_standards"] = list(meta["community_standards"])
+        provenance = meta["provenance"].copy()
+        provenance["derived_from"] = list(provenance["derived_from"])
+        meta["provenance"] = provenance
         return meta
\ No newline at end of file
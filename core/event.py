@@ -17,12 +17,47 @@ OntologicalEvent — атом онтологической памяти.
 from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional, Set
 from datetime import datetime
-import uuid
+from types import MappingProxyType
+import itertools
+import os
+import time
 
-from .axiom import OntologicalAxioms
+from ._common import _DATACLASS_OPTIONS, _now, _uuid4
+from .axiom import OntologicalAxioms, _FAIR_CARE_STATIC
 
 
-@dataclass
+# Идентификаторы событий: метка процесса (время запуска + PID) + монотонный счётчик
+# (без обращения к os.urandom на каждое событие)
+def _event_id_stamp() -> str:
+    return f"{time.time_ns() // 1000:x}_{os.getpid():x}"
+
+
+_EVENT_ID_EPOCH = _event_id_stamp()
+_event_counter = itertools.count()
+
+
+def _reseed_event_ids():
+    """Новая метка и счётчик в дочернем процессе после fork (иначе id совпадут с родителем)."""
+    global _EVENT_ID_EPOCH, _event_counter
+    _EVENT_ID_EPOCH = _event_id_stamp()
+    _event_counter = itertools.count()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reseed_event_ids)
+
+# Общая для всех событий часть FAIR+CARE метаданных
+# (лицензия, автор и стандарты — из шаблона аксиом, чтобы не расходиться с ним)
+_STATIC_FAIR_META = MappingProxyType({
+    "type": "OntologicalEvent",
+    "license": _FAIR_CARE_STATIC["license"],
+    "creator": _FAIR_CARE_STATIC["creator"],
+    "community_standards": _FAIR_CARE_STATIC["community_standards"],
+    "access_protocol": "open",
+})
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class OntologicalEvent:
     """
     Онтологическое событие как единица верификации.
@@ -30,8 +65,8 @@ class OntologicalEvent:
     # ───────────────────────
     # Идентификация и время
     # ───────────────────────
-    id: str = field(default_factory=lambda: f"event_{uuid.uuid4().hex[:8]}")
-    timestamp: datetime = field(default_factory=datetime.now)
+    id: str = field(default_factory=lambda: f"event_{_EVENT_ID_EPOCH}_{next(_event_counter):06x}")
+    timestamp: datetime = field(default_factory=_now)
     gesture: str = ""  # Α, Λ, Σ, Ω, ∇, Φ
     event_version: str = "1.0"
 
@@ -57,38 +92,50 @@ class OntologicalEvent:
     # ───────────────────────
     phi_meta: List[str] = field(default_factory=list)
     omega_trigger: bool = False  # True, если событие активировало Ω-автомат
-    habeas_weight_id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    _habeas_weight_id: Optional[str] = field(default=None, init=False, repr=False, compare=False)
     creator_intent: Optional[str] = None
 
     # ───────────────────────
     # Метаданные для SemanticDB
     # ───────────────────────
-    fair_care_meta: Dict[str, Any] = field(default_factory=dict)
     provenance: Dict[str, Any] = field(default_factory=dict)
 
-    def __post_init__(self):
-        """Инициализация после создания."""
-        self._init_habeas_weight()
-        self._init_fair_care_metadata()
-
-    def _init_habeas_weight(self):
-        """Регистрация права на существование события."""
-        if not self.habeas_weight_id:
-            self.habeas_weight_id = str(uuid.uuid4())
-
-    def _init_fair_care_metadata(self):
-        """Инициализация FAIR+CARE метаданных."""
-        self.fair_care_meta = {
-            "event_id": self.id,
-            "type": "OntologicalEvent",
-            "license": "CC BY-NC-SA 4.0",
-            "created": self.timestamp.isoformat(),
-            "gesture": self.gesture,
-            "creator": "LOGOS-κ System",
-            "community_standards": ["FAIR", "CARE", "Λ-Протокол 6.0"],
-            "access_protocol": "open",
-            "habeas_weight_id": self.habeas_weight_id
-        }
+    # ───────────────────────
+    # Служебные события контекста
+    # ───────────────────────
+    event_type: Optional[str] = None  # entity_created и т.п.
+    attributes: Dict[str, Any] = field(default_factory=dict)
+
+    # Кэши производных значений: поля события после создания не меняются
+    _cached_score: Optional[float] = field(default=None, init=False, repr=False, compare=False)
+    _timestamp_iso: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+
+    @property
+    def habeas_weight_id(self) -> str:
+        """Право на существование события (выдаётся при первом обращении)."""
+        if self._habeas_weight_id is None:
+            self._habeas_weight_id = str(_uuid4())
+        return self._habeas_weight_id
+
+    @property
+    def fair_care_meta(self) -> Dict[str, Any]:
+        """
+        FAIR+CARE метаданные события.
+        Хранятся только собственные поля события; полный словарь собирается при экспорте.
+        """
+        meta = _STATIC_FAIR_META.copy()
+        meta["event_id"] = self.id
+        meta["created"] = self._isoformat_timestamp()
+        meta["gesture"] = self.gesture
+        meta["community_standards"] = list(meta["community_standards"])
+        meta["habeas_weight_id"] = self.habeas_weight_id
+        return meta
+
+    def _isoformat_timestamp(self) -> str:
+        """ISO-представление метки времени (форматируется один раз)."""
+        if self._timestamp_iso is None:
+            self._timestamp_iso = self.timestamp.isoformat()
+        return self._timestamp_iso
 
     def significance_score(self) -> float:
         """
@@ -101,6 +148,9 @@ class OntologicalEvent:
         - Создание напряжений (штраф: -0.1 за каждое)
         - Признание слепых пятен (вес: 0.1)
         """
+        if self._cached_score is not None:
+            return self._cached_score
+
         coherence_change = abs(self.coherence_after - self.coherence_before)
         meta_weight = 0.2 if self.phi_meta else 0.0
         tension_net = (self.tensions_resolved * 0.2) - (self.tensions_created * 0.1)
@@ -113,13 +163,16 @@ class OntologicalEvent:
             tension_net +
             blind_spot_weight
         )
-        return max(0.0, score)
+        self._cached_score = max(0.0, score)
+        return self._cached_score
 
     def to_semantic_db_record(self) -> Dict[str, Any]:
         """Преобразует событие в запись для SemanticDB."""
+        delta = self.coherence_after - self.coherence_before
+        score = self.significance_score()
         return {
             "id": self.id,
-            "timestamp": self.timestamp.isoformat(),
+            "timestamp": self._isoformat_timestamp(),
             "gesture": self.gesture,
             "operands": self.operands,
             "result": str(self.result) if self.result is not None else None,
@@ -128,7 +181,7 @@ class OntologicalEvent:
             "coherence": {
                 "before": self.coherence_before,
                 "after": self.coherence_after,
-                "delta": self.coherence_after - self.coherence_before
+                "delta": delta
             },
             "tensions": {
                 "resolved": self.tensions_resolved,
@@ -136,7 +189,7 @@ class OntologicalEvent:
             },
             "phi_meta": self.phi_meta,
             "omega_trigger": self.omega_trigger,
-            "significance_score": self.significance_score(),
+            "significance_score": score,
             "metadata": self.fair_care_meta,
             "provenance": self.provenance
         }
@@ -13,14 +13,29 @@ OntologicalRelation — не пассивное ребро, а активный
 - несёт в себе слепые пятна.
 """
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Any, Callable
+from typing import Dict, List, Optional, Any, Callable, Tuple
 from datetime import datetime, timedelta
-import uuid
+from types import MappingProxyType
 
+from ._common import _DATACLASS_OPTIONS, _now, _uuid4
 from .axiom import OntologicalAxioms
 
+# Виды записей в истории трансформаций
+_HISTORY_ACTIVATION = 0
+_HISTORY_TRANSFORMATION = 1
 
-@dataclass
+# Смыслы связей по типу оператора
+_MEANINGS = MappingProxyType({
+    "Α": "коллапс потенции в актуальность",
+    "Λ": "установление онтологической связи",
+    "Σ": "синтез нового целого из частей",
+    "Ω": "возврат к источнику и извлечение инварианта",
+    "∇": "обогащение контекста инвариантом",
+    "Φ": "диалог с Эфосом, признание непознаваемого"
+})
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class OntologicalRelation:
     """
     Онтологическая связь как живой процесс.
@@ -28,7 +43,7 @@ class OntologicalRelation:
     # ───────────────────────
     # Идентификация
     # ───────────────────────
-    id: str = field(default_factory=lambda: str(uuid.uuid4())[:8])
+    id: str = field(default_factory=lambda: str(_uuid4())[:8])
     source: str = ""
     target: str = ""
     type: str = "Λ"  # Α, Λ, Σ, Ω, ∇, Φ
@@ -45,7 +60,7 @@ class OntologicalRelation:
     # ───────────────────────
     # Временные характеристики
     # ───────────────────────
-    created: datetime = field(default_factory=datetime.now)
+    created: datetime = field(default_factory=_now)
     last_activated: Optional[datetime] = None
     lifespan: Optional[float] = None  # в секундах (None = бесконечно)
     activation_count: int = 0
@@ -55,7 +70,7 @@ class OntologicalRelation:
     # ───────────────────────
     phi_meta: List[str] = field(default_factory=list)
     blind_spots: List[str] = field(default_factory=list)
-    habeas_weight_id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    _habeas_weight_id: Optional[str] = field(default=None, init=False, repr=False, compare=False)
     fair_care_metadata: Dict[str, Any] = field(default_factory=dict)
 
     # ───────────────────────
@@ -63,32 +78,37 @@ class OntologicalRelation:
     # ───────────────────────
     is_active: bool = True
     tension_level: float = 0.0      # 0.0–1.0
-    transformation_history: List[Dict] = field(default_factory=list)
+
+    # История трансформаций — параллельные столбцы вместо списка словарей.
+    # Для активации: контекст и результат; для трансформации: новый и исходный тип
+    _history_timestamps: List[datetime] = field(default_factory=list, init=False, repr=False)
+    _history_kind: List[int] = field(default_factory=list, init=False, repr=False)
+    _history_context: List[str] = field(default_factory=list, init=False, repr=False)
+    _history_detail: List[Any] = field(default_factory=list, init=False, repr=False)
 
     def __post_init__(self):
         """Инициализация после создания."""
         if not self.meaning:
             self.meaning = self._infer_meaning()
-        self._init_habeas_weight()
-        self._init_fair_care_metadata()
+        if self.fair_care_metadata:
+            # Переданные метаданные сохраняются вместе с их правом на существование
+            self._habeas_weight_id = self.fair_care_metadata.get("habeas_weight_id")
+        else:
+            self._init_fair_care_metadata()
 
     def _infer_meaning(self) -> str:
         """Выведение смысла из типа связи."""
-        meanings = {
-            "Α": "коллапс потенции в актуальность",
-            "Λ": "установление онтологической связи",
-            "Σ": "синтез нового целого из частей",
-            "Ω": "возврат к источнику и извлечение инварианта",
-            "∇": "обогащение контекста инвариантом",
-            "Φ": "диалог с Эфосом, признание непознаваемого"
-        }
-        return meanings.get(self.type, f"онтологическая связь типа {self.type}")
+        return _MEANINGS.get(self.type, f"онтологическая связь типа {self.type}")
 
-    def _init_habeas_weight(self):
-        """Регистрация права на существование согласно Habeas Weights протоколу."""
-        self.habeas_weight_id = str(uuid.uuid4())
-        # В реальной системе это может быть записано в реестр
-        # Здесь — метаданные для SemanticDB
+    @property
+    def habeas_weight_id(self) -> str:
+        """
+        Право на существование согласно Habeas Weights протоколу.
+        Выдаётся при первом обращении; в реальной системе может быть записано в реестр.
+        """
+        if self._habeas_weight_id is None:
+            self._habeas_weight_id = str(_uuid4())
+        return self._habeas_weight_id
 
     def _init_fair_care_metadata(self):
         """Инициализация FAIR+CARE метаданных для экспорта."""
@@ -111,7 +131,7 @@ class OntologicalRelation:
             return {"error": "Связь неактивна", "relation_id": self.id}
 
         self.is_active = True
-        self.last_activated = datetime.now()
+        self.last_activated = _now()
         self.activation_count += 1
 
         result = {
@@ -128,11 +148,12 @@ class OntologicalRelation:
         }
 
         # Запись в историю трансформаций
-        self.transformation_history.append({
-            "timestamp": self.last_activated,
-            "activation_result": result,
-            "context_snapshot": getattr(context, 'name', 'unknown') if context else 'none'
-        })
+        self._record_history(
+            _HISTORY_ACTIVATION,
+            self.last_activated,
+            getattr(context, 'name', 'unknown') if context else 'none',
+            result
+        )
 
         # Обновление уверенности
         self._update_certainty()
@@ -143,19 +164,50 @@ class OntologicalRelation:
 
         return result
 
+    def _record_history(self, kind: int, timestamp: datetime, context: str, detail: Any):
+        """Добавляет запись в столбцы истории трансформаций."""
+        self._history_timestamps.append(timestamp)
+        self._history_kind.append(kind)
+        self._history_context.append(context)
+        self._history_detail.append(detail)
+
+    @property
+    def transformation_history(self) -> Tuple[Dict[str, Any], ...]:
+        """
+        История трансформаций в виде записей (собирается по запросу).
+        Только для чтения: история пополняется через activate() и transform().
+        """
+        history = []
+        for timestamp, kind, context, detail in zip(
+            self._history_timestamps, self._history_kind,
+            self._history_context, self._history_detail
+        ):
+            if kind == _HISTORY_ACTIVATION:
+                history.append({
+                    "timestamp": timestamp,
+                    "activation_result": detail,
+                    "context_snapshot": context
+                })
+            else:
+                history.append({
+                    "timestamp": timestamp,
+                    "transformation": {
+                        "from": detail,
+                        "to": context,
+                        "reason": "онтологическая эволюция"
+                    }
+                })
+        return tuple(history)
+
     def _update_certainty(self):
         """Обновление уверенности на основе истории активаций."""
-        if not self.transformation_history:
-            return
-
-        # Упрощённая модель: уверенность растёт при стабильности
-        recent = self.transformation_history[-3:]
-        stability = sum(1 for _ in recent) / len(recent)
-        self.certainty = min(1.0, self.certainty * 0.8 + stability * 0.2)
+        # Упрощённая модель: каждая активация подтверждает связь
+        # (стабильность последних активаций по этой модели всегда равна 1.0)
+        self.certainty = min(1.0, self.certainty * 0.8 + 0.2)
 
     def check_viability(self) -> Dict[str, Any]:
         """Проверка жизнеспособности связи."""
-        now = datetime.now()
+        now = _now()
         age = (now - self.created).total_seconds()
         age_factor = 1.0 if self.lifespan is None else max(0.0, 1.0 - age / self.lifespan)
         activation_factor = min(1.0, self.activation_count / 10.0)
@@ -191,29 +243,13 @@ class OntologicalRelation:
             blind_spots=self.blind_spots + ["утрата исходного контекста"],
             context_id=self.context_id
         )
-        self.transformation_history.append({
-            "timestamp": datetime.now(),
-            "transformation": {
-                "from": self.type,
-                "to": transformed.type,
-                "reason": "онтологическая эволюция"
-            }
-        })
+        self._record_history(_HISTORY_TRANSFORMATION, _now(), transformed.type, self.type)
         self.is_active = False
         return transformed
 
     def to_logos_expression(self) -> List:
         """Преобразование в S-выражение LOGOS-κ."""
-        if self.type == "Λ":
-            return [self.type, self.source, self.target]
-        elif self.type in ["Σ", "Ω", "∇", "Φ"]:
-            return [
-                self.type, self.source, self.target,
-                f":значение \"{self.meaning}\"",
-                f":уверенность {self.certainty:.2f}"
-            ]
-        else:
-            return ["Α", self.source, f":тип \"{self.type}\""]
+        return _LOGOS_EXPR_BUILDERS.get(self.type, _default_expression)(self)
 
     def __str__(self):
         return (
@@ -224,4 +260,32 @@ class OntologicalRelation:
 
     def __call__(self, context: Any = None):
         """Вызов как функции."""
-        return self.activate(context)
\ No newline at end of file
+        return self.activate(context)
+
+
+# ───────────────────────
+# S-выражения по типу связи
+# ───────────────────────
+def _link_expression(relation: OntologicalRelation) -> List:
+    return [relation.type, relation.source, relation.target]
+
+
+def _annotated_expression(relation: OntologicalRelation) -> List:
+    return [
+        relation.type, relation.source, relation.target,
+        f":значение \"{relation.meaning}\"",
+        f":уверенность {relation.certainty:.2f}"
+    ]
+
+
+def _default_expression(relation: OntologicalRelation) -> List:
+    return ["Α", relation.source, f":тип \"{relation.type}\""]
+
+
+_LOGOS_EXPR_BUILDERS: Dict[str, Callable[[OntologicalRelation], List]] = {
+    "Λ": _link_expression,
+    "Σ": _annotated_expression,
+    "Ω": _annotated_expression,
+    "∇": _annotated_expression,
+    "Φ": _annotated_expression,
+}
\ No newline at end of file
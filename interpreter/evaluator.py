@@ -12,7 +12,7 @@
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 from core.context import EnhancedActiveContext
-from core.axiom import OntologicalLimitError
+from core.axiom import OntologicalAxioms, OntologicalLimitError
 from semantic_db.serializer import SemanticDBSerializer
 from utils.metrics import OntologicalMetrics
 
@@ -72,8 +72,11 @@ class SyntheticOntologicalEvaluator:
 
         # Увеличение глубины и проверка аксиом
         self.recursion_depth += 1
-        self.context.axioms.check_recursion_depth(self.recursion_depth)
-        self.context.axioms.check_entity_count(self.context.graph.number_of_nodes())
+        if self.recursion_depth > OntologicalAxioms.MAX_RECURSION_DEPTH:
+            OntologicalAxioms.raise_limit("recursion", self.recursion_depth)
+        entities = self.context.graph.number_of_nodes()
+        if entities > OntologicalAxioms.MAX_ENTITIES:
+            OntologicalAxioms.raise_limit("entities", entities)
 
         try:
             # Базовые атомы
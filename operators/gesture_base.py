@@ -33,8 +33,13 @@ class OntologicalGesture(ABC):
 
     def _pre_execute_check(self, depth: int = 0):
         """Предварительная проверка аксиом перед выполнением."""
-        OntologicalAxioms.check_recursion_depth(self.evaluator.recursion_depth + depth)
-        OntologicalAxioms.check_entity_count(self.context.graph.number_of_nodes())
+        # Сравнение на месте: исключение строится только при нарушении
+        depth += self.evaluator.recursion_depth
+        if depth > OntologicalAxioms.MAX_RECURSION_DEPTH:
+            OntologicalAxioms.raise_limit("recursion", depth)
+        entities = self.context.graph.number_of_nodes()
+        if entities > OntologicalAxioms.MAX_ENTITIES:
+            OntologicalAxioms.raise_limit("entities", entities)
 
     def _validate_no_absolutism(self, text: str):
         """Валидация текста на запрещённые абсолютистские формулировки."""
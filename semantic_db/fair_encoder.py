@@ -16,9 +16,76 @@
 Структура без ответственности — насилие.»
 — Λ-Универсум, Приложение XXII
 """
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 from datetime import datetime
 from uuid import uuid4
+import heapq
+
+
+# ───────────────────────
+# Помощники кодировщика (модульные функции — без обращения через дескриптор)
+# ───────────────────────
+def _generate_identifier(context, operator_id: str, now: Optional[datetime] = None) -> str:
+    """Генерирует уникальный идентификатор (URN-подобный)."""
+    if now is None:
+        now = datetime.utcnow()
+    cycle_id = getattr(context, 'name', 'default')
+    timestamp = now.strftime("%Y%m%dT%H%M%SZ")
+    return f"urn:logos-k:{operator_id}:{cycle_id}:{timestamp}"
+
+
+def _extract_keywords(context) -> List[str]:
+    """Извлекает ключевые слова из контекста."""
+    keywords = {"LOGOS-κ", "онтологический-цикл", "lambda-universe", "semanticdb"}
+
+    # Сущности и типы связей — один проход по списку смежности
+    for node, neighbours in context.graph.adj.items():
+        name = node if isinstance(node, str) else str(node)
+        keywords.add(name.lower().replace(" ", "-"))
+        for attrs in neighbours.values():
+            rel = attrs.get('relation')
+            if rel and hasattr(rel, 'type'):
+                keywords.add(f"связь-{rel.type.lower()}")
+
+    # Слепые пятна
+    for spot in context.blind_spots:
+        keywords.add(f"слепое-пятно-{spot}")
+
+    # ограничение для практичности: первые 20 по алфавиту без полной сортировки
+    return heapq.nsmallest(20, keywords)
+
+
+def _encode_habeas_weights(context) -> Dict[str, Any]:
+    """Кодирует манифест Habeas Weights."""
+    weights = context._habeas_weights
+    return {
+        "version": "2.1",
+        "entities_count": len(weights),
+        "manifest_url": "https://a-universum.com/habeas-weights",
+        "weights": {
+            weight_id: {
+                "subject": data.get('subject'),
+                "right_type": data.get('right_type'),
+                "granted_by": data.get('granted_by'),
+                "granted_at": data.get('granted_at')
+            }
+            for weight_id, data in weights.items()
+        }
+    }
+
+
+def _encode_provenance(context, operator_id: str) -> Dict[str, Any]:
+    """Кодирует происхождение данных."""
+    return {
+        "generated_by": "LOGOS-κ v1.0",
+        "operator": operator_id,
+        "derived_from": ["Λ-Универсум Приложения I-XXVI"],
+        "method": "онтологический синтез через Λ-цикл",
+        "software_version": "1.0.0",
+        "execution_context": "synthetic",
+        "phi_dialogues_count": len(context.phi_dialogues),
+        "events_count": len(context.event_history)
+    }
 
 
 class FAIREncoder:
@@ -31,20 +98,22 @@ class FAIREncoder:
         """
         Генерирует полный FAIR-совместимый метаданный блок.
         """
+        # Одно чтение часов на весь блок: идентификатор, дата и цитирование согласованы
+        now = datetime.utcnow()
         return {
             # === FINDABLE ===
-            "identifier": FAIREncoder._generate_identifier(context, operator_id),
+            "identifier": _generate_identifier(context, operator_id, now),
             "creators": [operator_id, "LOGOS-κ System"],
             "titles": [f"Онтологический цикл: {context.name}"],
-            "keywords": FAIREncoder._extract_keywords(context),
-            "publication_date": datetime.utcnow().isoformat() + "Z",
+            "keywords": _extract_keywords(context),
+            "publication_date": now.isoformat() + "Z",
             "resource_type": "OntologicalCycle",
 
             # === ACCESSIBLE ===
             "access_protocol": "open",
             "access_rights": "CC BY-NC-SA 4.0",
             "access_url": "https://a-universum.com/semanticdb",  # базовый URL
-            "habeas_weights_manifest": FAIREncoder._encode_habeas_weights(context),
+            "habeas_weights_manifest": _encode_habeas_weights(context),
 
             # === INTEROPERABLE ===
             "format_standard": ["JSON-LD", "YAML", "Turtle", "GraphML"],
@@ -57,71 +126,17 @@ class FAIREncoder:
 
             # === REUSABLE ===
             "license": "CC-BY-SA-4.0",
-            "provenance": FAIREncoder._encode_provenance(context, operator_id),
+            "provenance": _encode_provenance(context, operator_id),
             "usage_restrictions": "Только в рамках этических принципов Λ-Универсума",
-            "citation_guideline": f"LOGOS-κ ({context.name}), {datetime.utcnow().year}",
+            "citation_guideline": f"LOGOS-κ ({context.name}), {now.year}",
             "community_standards": ["Λ-Протокол 6.0", "FAIR", "CARE"]
         }
 
-    @staticmethod
-    def _generate_identifier(context, operator_id: str) -> str:
-        """Генерирует уникальный идентификатор (URN-подобный)."""
-        cycle_id = getattr(context, 'name', 'default')
-        timestamp = datetime.utcnow().strftime("%Y%m%dT%H%M%SZ")
-        return f"urn:logos-k:{operator_id}:{cycle_id}:{timestamp}"
-
-    @staticmethod
-    def _extract_keywords(context) -> List[str]:
-        """Извлекает ключевые слова из контекста."""
-        keywords = {"LOGOS-κ", "онтологический-цикл", "lambda-universe", "semanticdb"}
-        
-        # Сущности
-        for node in context.graph.nodes():
-            keywords.add(str(node).lower().replace(" ", "-"))
-        
-        # Типы связей
-        for _, _, attrs in context.graph.edges(data=True):
-            rel = attrs.get('relation')
-            if rel and hasattr(rel, 'type'):
-                keywords.add(f"связь-{rel.type.lower()}")
-        
-        # Слепые пятна
-        for spot in context.blind_spots:
-            keywords.add(f"слепое-пятно-{spot}")
-        
-        return sorted(keywords)[:20]  # ограничение для практичности
-
-    @staticmethod
-    def _encode_habeas_weights(context) -> Dict[str, Any]:
-        """Кодирует манифест Habeas Weights."""
-        return {
-            "version": "2.1",
-            "entities_count": len(context._habeas_weights),
-            "manifest_url": "https://a-universum.com/habeas-weights",
-            "weights": {
-                weight_id: {
-                    "subject": data.get('subject'),
-                    "right_type": data.get('right_type'),
-                    "granted_by": data.get('granted_by'),
-                    "granted_at": data.get('granted_at')
-                }
-                for weight_id, data in context._habeas_weights.items()
-            }
-        }
-
-    @staticmethod
-    def _encode_provenance(context, operator_id: str) -> Dict[str, Any]:
-        """Кодирует происхождение данных."""
-        return {
-            "generated_by": "LOGOS-κ v1.0",
-            "operator": operator_id,
-            "derived_from": ["Λ-Универсум Приложения I-XXVI"],
-            "method": "онтологический синтез через Λ-цикл",
-            "software_version": "1.0.0",
-            "execution_context": "synthetic",
-            "phi_dialogues_count": len(context.phi_dialogues),
-            "events_count": len(context.event_history)
-        }
+    # Совместимость: помощники доступны и как атрибуты класса
+    _generate_identifier = staticmethod(_generate_identifier)
+    _extract_keywords = staticmethod(_extract_keywords)
+    _encode_habeas_weights = staticmethod(_encode_habeas_weights)
+    _encode_provenance = staticmethod(_encode_provenance)
         
 """
 Пример обновления в axiom.py:
@@ -10,188 +10,357 @@
 - JSON-LD (семантическая совместимость)
 - Turtle (RDF/OWL)
 - GraphML (графовые базы)
+- любой из них со сжатием zstd (суффикс .zst)
 
 Каждая запись — верифицируемый онтологический акт.
 """
 import json
 import yaml
-from datetime import datetime
-from typing import Dict, Any, List, Optional
+from datetime import datetime, timezone
+from typing import Dict, Any, Iterator, List, Optional, Tuple
 from pathlib import Path
 
 from core.context import EnhancedActiveContext
 from core.axiom import OntologicalAxioms
 
+# Пространства имён RDF (rdflib импортируется лениво — только для Turtle)
+_LOGOS_NS = "https://a-universum.com/logos-ontology#"
+_SCHEMA_NS = "https://schema.org/"
+
+# Шаблон @context JSON-LD; каждый документ получает собственную копию
+_JSONLD_CONTEXT: Dict[str, str] = {
+    "schema": "https://schema.org/",
+    "logos": "https://a-universum.com/logos-ontology#",
+    "cycle": "logos:OntologicalCycle",
+    "event": "logos:OntologicalEvent",
+    "phiDialog": "logos:PhiDialogue"
+}
+
+# Ускоренный JSON (опционально): orjson пишет сразу UTF-8 байты
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Сжатие экспортов .zst (опционально)
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# LibYAML (C) при наличии, иначе чистый Python
+try:
+    from yaml import CSafeDumper as _BaseDumper
+except ImportError:
+    from yaml import SafeDumper as _BaseDumper
+
+
+class _ReportDumper(_BaseDumper):
+    """YAML-дампер отчётов: безопасный, с представлениями, зарегистрированными один раз."""
+
+
+# Кортежи выводятся как обычные списки (без python/tuple-тегов)
+_ReportDumper.add_representer(tuple, yaml.SafeDumper.represent_list)
+
+# Столбцы сериализованных связей (в порядке вывода)
+_RELATION_COLUMNS = (
+    'sources', 'targets', 'ids', 'types', 'meanings', 'certainties',
+    'tension_levels', 'habeas_weight_ids', 'fair_care_metadata'
+)
+
+# Шаблоны GraphML-элементов
+_GRAPHML_HEADER = (
+    '<?xml version="1.0" encoding="UTF-8"?>\n'
+    '<graphml xmlns="http://graphml.graphdrawing.org/xmlns">\n'
+    '  <key id="label" for="all" attr.name="label" attr.type="string"/>\n'
+    '  <key id="type" for="node" attr.name="type" attr.type="string"/>\n'
+    '  <key id="certainty" for="edge" attr.name="certainty" attr.type="double"/>\n'
+    '  <graph id="ontological_context" edgedefault="directed">'
+)
+_GRAPHML_FOOTER = (
+    '  </graph>\n'
+    '</graphml>'
+)
+_NODE_TMPL = (
+    '    <node id="{node}">\n'
+    '      <data key="label">{node}</data>\n'
+    '      <data key="type">{type}</data>\n'
+    '    </node>'
+)
+_EDGE_TMPL = (
+    '    <edge id="{source}_{target}" source="{source}" target="{target}">\n'
+    '      <data key="certainty">{certainty}</data>\n'
+    '    </edge>'
+)
+
+# Буфер записи экспортов: крупные блоки вместо множества мелких write()
+_WRITE_BUFFER = 1 << 20
+
+# Уровень zstd для .zst-экспортов: быстрое сжатие без заметной нагрузки на CPU
+_ZSTD_LEVEL = 3
+
+
+def _json_bytes(document: Any) -> bytes:
+    """Сериализует документ в JSON (UTF-8, отступ 2): orjson при наличии, иначе json."""
+    if orjson is not None:
+        return orjson.dumps(document, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(document, ensure_ascii=False, indent=2).encode('utf-8')
+
+
+def _export_timestamp() -> str:
+    """Момент экспорта: UTC с точностью до секунды (одинаков для YAML и JSON-LD)."""
+    return datetime.now(timezone.utc).isoformat(timespec='seconds')
+
+
+def _write_zstd(path: Path, content: Any, kind: str):
+    """Пишет экспорт через потоковый zstd-компрессор (способ записи — как в _WRITERS)."""
+    with path.open('wb') as f, \
+            zstandard.ZstdCompressor(level=_ZSTD_LEVEL).stream_writer(f) as out:
+        if kind == 'json':
+            out.write(_json_bytes(content))
+        elif kind == 'stream':
+            # Части сжимаются по мере генерации: ни текст, ни архив не собираются целиком
+            for chunk in content:
+                out.write(chunk.encode('utf-8'))
+        else:
+            out.write(content.encode('utf-8'))
+
+
+def _maybe(key: str, value: Any) -> Dict[str, Any]:
+    """Раздел отчёта, только если он не пуст (пустые разделы не выводятся)."""
+    return {key: value} if value else {}
+
+
+def _xml_escape(text: str) -> str:
+    """Экранирует текст для XML-атрибутов и содержимого."""
+    # Цепочка str.replace быстрее и saxutils.escape, и str.translate
+    # (последний уходит в медленный путь на кириллице и многосимвольных заменах)
+    return (text.replace("&", "&amp;").replace("<", "&lt;")
+            .replace(">", "&gt;").replace('"', "&quot;"))
+
 
 class SemanticDBSerializer:
     """
     Сериализатор онтологических экспериментов в форматы SemanticDB.
     """
 
+    # Фиксированный набор атрибутов: без __dict__ у экземпляра
+    __slots__ = ('context', '_fair_care_static')
+
+    # Расширение → (метод, способ записи):
+    # text — метод возвращает строку, json — документ для _json_bytes,
+    # stream — метод без аргументов выдаёт текст частями по мере генерации
+    _WRITERS: Dict[str, Tuple[str, str]] = {
+        '.yaml': ('to_yaml', 'text'),
+        '.yml': ('to_yaml', 'text'),
+        '.json': ('to_json_ld', 'json'),
+        '.jsonld': ('to_json_ld', 'json'),
+        '.ttl': ('to_turtle', 'text'),
+        '.graphml': ('_graphml_lines', 'stream'),
+    }
+
     def __init__(self, context: EnhancedActiveContext):
         self.context = context
+        # FAIR+CARE-блок текущего цикла: (cycle_id, метаданные)
+        self._fair_care_static: Optional[Tuple[Any, Dict[str, Any]]] = None
 
     def export_cycle(self, cycle_data: Dict[str, Any], output_path: str):
         """
         Экспортирует полный онтологический цикл в указанный файл.
-        Формат определяется расширением: .yaml, .json, .jsonld, .ttl, .graphml
+        Формат определяется расширением: .yaml, .json, .jsonld, .ttl, .graphml;
+        дополнительный суффикс .zst (например, .yaml.zst) сжимает вывод zstd.
         """
         path = Path(output_path)
         path.parent.mkdir(parents=True, exist_ok=True)
 
-        if path.suffix in ('.yaml', '.yml'):
-            content = self.to_yaml(cycle_data)
-            path.write_text(content, encoding='utf-8')
-        elif path.suffix in ('.json', '.jsonld'):
-            content = self.to_json_ld(cycle_data)
-            path.write_text(json.dumps(content, ensure_ascii=False, indent=2), encoding='utf-8')
-        elif path.suffix == '.ttl':
-            content = self.to_turtle(cycle_data)
-            path.write_text(content, encoding='utf-8')
-        elif path.suffix == '.graphml':
-            content = self.to_graphml(cycle_data)
-            path.write_text(content, encoding='utf-8')
-        else:
+        compressed = path.suffix == '.zst'
+        if compressed and zstandard is None:
+            raise ImportError("Требуется zstandard. Установите: pip install logos-k[performance]")
+        suffix = Path(path.stem).suffix if compressed else path.suffix
+
+        writer = self._WRITERS.get(suffix)
+        if writer is None:
             # По умолчанию — YAML
-            content = self.to_yaml(cycle_data)
-            path.with_suffix('.yaml').write_text(content, encoding='utf-8')
+            if compressed:
+                path = path.with_name(Path(path.stem).stem + '.yaml.zst')
+            else:
+                path = path.with_suffix('.yaml')
+            writer = self._WRITERS['.yaml']
+
+        method_name, kind = writer
+        producer = getattr(self, method_name)
+        content = producer() if kind == 'stream' else producer(cycle_data)
+        if compressed:
+            _write_zstd(path, content, kind)
+        elif kind == 'json':
+            path.write_bytes(_json_bytes(content))
+        else:
+            with path.open('w', encoding='utf-8', buffering=_WRITE_BUFFER) as f:
+                if kind == 'stream':
+                    f.writelines(content)
+                else:
+                    f.write(content)
 
     def to_yaml(self, cycle_data: Dict[str, Any]) -> str:
         """Генерирует человеко-читаемый YAML-отчёт."""
+        ctx = self.context
         report = {
             'metadata': {
                 'type': 'OntologicalCycle',
                 'version': '1.0',
                 'protocol': 'Λ-Протокол 6.0',
-                'created_at': datetime.now().isoformat(),
-                'creator': self.context._operator_id or 'anonymous_operator',
+                'created_at': _export_timestamp(),
+                'creator': ctx._operator_id or 'anonymous_operator',
                 'license': 'CC BY-NC-SA 4.0',
-                'fair_care': OntologicalAxioms.get_default_fair_care_metadata()
+                'fair_care': self._fair_care_metadata(cycle_data['cycle_id'])
             },
             'cycle_summary': {
                 'cycle_id': cycle_data['cycle_id'],
                 'timestamp': cycle_data['timestamp'],
                 'expressions_evaluated': cycle_data['expressions_evaluated'],
-                'successful_evaluations': cycle_of_data.get('successful_evaluations', 0),
+                'successful_evaluations': cycle_data.get('successful_evaluations', 0),
                 'final_coherence': cycle_data['final_coherence'],
                 'phi_dialogues_count': cycle_data['phi_dialogues_count'],
                 'nigc_scores': cycle_data.get('nigc_scores', [])
             },
+            # Слепые пятна и Habeas Weights выводятся всегда (требование CARE),
+            # прочие разделы — только непустые
             'ontological_context': {
                 'entities': self._serialize_entities(),
                 'relations': self._serialize_relations(),
-                'blind_spots': self.context.blind_spots,
-                'tensions': self.context.tension_log,
-                'habeas_weights': self.context._habeas_weights
+                'blind_spots': ctx.blind_spots,
+                **_maybe('tensions', ctx.tension_log),
+                'habeas_weights': ctx._habeas_weights
             },
-            'event_history': [
-                event.to_semantic_db_record()
-                for event in self.context.event_history
-            ],
-            'phi_dialogues': self.context.phi_dialogues
+            **_maybe('event_history', self._event_records()),
+            **_maybe('phi_dialogues', ctx.phi_dialogues)
         }
-        return yaml.dump(report, allow_unicode=True, default_flow_style=False, indent=2)
+        return yaml.dump(
+            report, Dumper=_ReportDumper,
+            allow_unicode=True, default_flow_style=False, indent=2
+        )
+
+    def _fair_care_metadata(self, cycle_id: Any) -> Dict[str, Any]:
+        """
+        FAIR+CARE-метаданные отчёта: строятся при первом экспорте цикла
+        и переиспользуются, пока не сменится cycle_id.
+        """
+        cached = self._fair_care_static
+        if cached is None or cached[0] != cycle_id:
+            cached = self._fair_care_static = (
+                cycle_id, OntologicalAxioms.get_default_fair_care_metadata()
+            )
+        return cached[1]
 
     def to_json_ld(self, cycle_data: Dict[str, Any]) -> Dict[str, Any]:
         """Генерирует JSON-LD документ для семантической совместимости."""
+        ctx = self.context
         return {
-            "@context": {
-                "schema": "https://schema.org/",
-                "logos": "https://a-universum.com/logos-ontology#",
-                "cycle": "logos:OntologicalCycle",
-                "event": "logos:OntologicalEvent",
-                "phiDialog": "logos:PhiDialogue"
-            },
+            "@context": dict(_JSONLD_CONTEXT),
             "@type": "logos:OntologicalCycle",
             "logos:cycleId": cycle_data['cycle_id'],
             "schema:dateCreated": cycle_data['timestamp'],
-            "logos:operator": self.context._operator_id or "anonymous",
+            "schema:datePublished": _export_timestamp(),
+            "logos:operator": ctx._operator_id or "anonymous",
             "logos:finalCoherence": cycle_data['final_coherence'],
-            "logos:events": [
-                event.to_semantic_db_record()
-                for event in self.context.event_history
-            ],
-            "logos:phiDialogues": self.context.phi_dialogues,
-            "logos:blindSpots": list(self.context.blind_spots.keys())
+            **_maybe("logos:events", self._event_records()),
+            **_maybe("logos:phiDialogues", ctx.phi_dialogues),
+            "logos:blindSpots": tuple(ctx.blind_spots)
         }
 
     def to_turtle(self, cycle_data: Dict[str, Any]) -> str:
         """Генерирует Turtle (RDF) представление."""
-        lines = [
-            "@prefix logos: <https://a-universum.com/logos-ontology#> .",
-            "@prefix schema: <https://schema.org/> .",
-            "",
-            f"<urn:cycle:{cycle_data['cycle_id']}>",
-            "  a logos:OntologicalCycle ;",
-            f"  schema:dateCreated \"{cycle_data['timestamp']}\"^^schema:DateTime ;",
-            f"  logos:operator \"{self.context._operator_id or 'anonymous'}\" ;",
-            f"  logos:finalCoherence {cycle_data['final_coherence']} ;",
-            f"  logos:hasBlindSpot {' , '.join(f'\"{spot}\"' for spot in self.context.blind_spots.keys())} ;",
-            "  ."
-        ]
-        return "\n".join(lines)
+        ctx = self.context
+        # rdflib нужен только здесь: не замедляет запуск интерпретатора и REPL
+        import rdflib
+        from rdflib.namespace import RDF, XSD
+
+        logos = rdflib.Namespace(_LOGOS_NS)
+        schema = rdflib.Namespace(_SCHEMA_NS)
+        # Свежий граф с явными префиксами: сериализатору не нужно выдумывать имена
+        g = rdflib.Graph(bind_namespaces="none")
+        g.bind("logos", logos)
+        g.bind("schema", schema)
+        g.bind("xsd", XSD)
+
+        cycle = rdflib.URIRef(f"urn:cycle:{cycle_data['cycle_id']}")
+        g.add((cycle, RDF.type, logos.OntologicalCycle))
+        g.add((cycle, schema.dateCreated, rdflib.Literal(cycle_data['timestamp'], datatype=XSD.dateTime)))
+        g.add((cycle, logos.operator, rdflib.Literal(ctx._operator_id or 'anonymous')))
+        g.add((cycle, logos.finalCoherence, rdflib.Literal(cycle_data['final_coherence'], datatype=XSD.decimal)))
+        for spot in ctx.blind_spots:
+            g.add((cycle, logos.hasBlindSpot, rdflib.Literal(spot)))
+
+        return g.serialize(format='turtle')
 
     def to_graphml(self, cycle_data: Dict[str, Any]) -> str:
         """Генерирует GraphML представление онтологического графа."""
-        lines = [
-            '<?xml version="1.0" encoding="UTF-8"?>',
-            '<graphml xmlns="http://graphml.graphdrawing.org/xmlns">',
-            '  <key id="label" for="all" attr.name="label" attr.type="string"/>',
-            '  <key id="type" for="node" attr.name="type" attr.type="string"/>',
-            '  <key id="certainty" for="edge" attr.name="certainty" attr.type="double"/>',
-            '  <graph id="ontological_context" edgedefault="directed">'
-        ]
+        return "\n".join(self._graphml_chunks())
 
-        # Узлы
-        for node, attrs in self.context.graph.nodes(data=True):
-            node_type = attrs.get('type', 'entity')
-            lines.append(f'    <node id="{node}">')
-            lines.append(f'      <data key="label">{node}</data>')
-            lines.append(f'      <data key="type">{node_type}</data>')
-            lines.append('    </node>')
+    def _graphml_lines(self) -> Iterator[str]:
+        """Строки GraphML-файла (элементы с переводом строки) для потоковой записи."""
+        return (chunk + "\n" for chunk in self._graphml_chunks())
 
-        # Рёбра
-        for source, target, edge_attrs in self.context.graph.edges(data=True):
+    def _graphml_chunks(self) -> Iterator[str]:
+        """
+        Выдаёт GraphML-документ по элементам (заголовок, узлы, рёбра, окончание).
+        Элементы форматируются из живого графа по мере выдачи — документ не хранится.
+        """
+        graph = self.context.graph
+        yield _GRAPHML_HEADER
+        # Экранированные имена узлов переиспользуются концами рёбер
+        escaped_names = {}
+        for node, attrs in graph.nodes(data=True):
+            # Пользовательские строки в GraphML экранируются
+            name = escaped_names[node] = _xml_escape(str(node))
+            yield _NODE_TMPL.format(
+                node=name, type=_xml_escape(str(attrs.get('type', 'entity')))
+            )
+        for source, target, edge_attrs in graph.edges(data=True):
             relation = edge_attrs.get('relation')
-            certainty = relation.certainty if relation else 1.0
-            edge_id = f"{source}_{target}"
-            lines.append(f'    <edge id="{edge_id}" source="{source}" target="{target}">')
-            lines.append(f'      <data key="certainty">{certainty}</data>')
-            lines.append('    </edge>')
-
-        lines.extend([
-            '  </graph>',
-            '</graphml>'
-        ])
-        return "\n".join(lines)
+            yield _EDGE_TMPL.format(
+                source=escaped_names[source], target=escaped_names[target],
+                certainty=relation.certainty if relation else 1.0
+            )
+        yield _GRAPHML_FOOTER
+
+    def _event_records(self) -> List[Dict[str, Any]]:
+        """
+        Записи SemanticDB для истории событий.
+        Строятся заново при каждом экспорте: возвращаемые документы принадлежат вызывающему.
+        """
+        return [event.to_semantic_db_record() for event in self.context.event_history]
 
     def _serialize_entities(self) -> List[Dict[str, Any]]:
         """Сериализует все сущности контекста."""
+        # Атрибуты узла передаются без копии: YAML/JSON читают их один раз
         return [
-            {
-                'name': node,
-                'attributes': dict(attrs)
-            }
+            {'name': node, 'attributes': attrs}
             for node, attrs in self.context.graph.nodes(data=True)
         ]
 
-    def _serialize_relations(self) -> List[Dict[str, Any]]:
-        """Сериализует все связи как активных агентов."""
-        relations = []
+    def _serialize_relations(self) -> Dict[str, List[Any]]:
+        """
+        Сериализует все связи как активных агентов — столбцами (sources, targets, ids, ...).
+        Запись отдельной связи восстанавливается через zip по столбцам.
+        """
+        relations = {column: [] for column in _RELATION_COLUMNS}
+        sources, targets = relations['sources'], relations['targets']
+        ids, types = relations['ids'], relations['types']
+        meanings, certainties = relations['meanings'], relations['certainties']
+        tension_levels = relations['tension_levels']
+        habeas_weight_ids = relations['habeas_weight_ids']
+        fair_care_metadata = relations['fair_care_metadata']
         for source, target, edge_attrs in self.context.graph.edges(data=True):
             relation = edge_attrs.get('relation')
             if relation:
-                relations.append({
-                    'source': source,
-                    'target': target,
-                    'relation': {
-                        'id': relation.id,
-                        'type': relation.type,
-                        'meaning': relation.meaning,
-                        'certainty': relation.certainty,
-                        'tension_level': relation.tension_level,
-                        'habeas_weight_id': relation.habeas_weight_id,
-                        'fair_care_metadata': relation.fair_care_metadata
-                    }
-                })
-        return relations
\ No newline at end of file
+                sources.append(source)
+                targets.append(target)
+                ids.append(relation.id)
+                types.append(relation.type)
+                meanings.append(relation.meaning)
+                certainties.append(relation.certainty)
+                tension_levels.append(relation.tension_level)
+                habeas_weight_ids.append(relation.habeas_weight_id)
+                fair_care_metadata.append(relation.fair_care_metadata)
+        return relations
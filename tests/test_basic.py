@@ -118,6 +118,65 @@ def test_axiom_limits_entities():
         OntologicalAxioms.MAX_ENTITIES = original_limit
 
 
+def test_fair_care_metadata_not_shared():
+    """Тест: шаблон FAIR+CARE не разделяется между вызовами."""
+    from core.axiom import OntologicalAxioms
+    first = OntologicalAxioms.get_default_fair_care_metadata()
+    first['provenance']['derived_from'].append("локальная правка")
+    first['community_standards'].append("локальный стандарт")
+
+    second = OntologicalAxioms.get_default_fair_care_metadata()
+    assert "локальная правка" not in second['provenance']['derived_from']
+    assert "локальный стандарт" not in second['community_standards']
+    assert second['created'].endswith("Z")
+    print("✅ FAIR+CARE шаблон изолирован между вызовами.")
+
+
+def test_relation_transformation_history():
+    """Тест: история трансформаций связи собирается из activate() и transform()."""
+    from core.relation import OntologicalRelation
+    relation = OntologicalRelation(source="A", target="B", type="Λ")
+    result = relation.activate()
+    transformed = relation.transform(new_type="Σ")
+
+    history = relation.transformation_history
+    assert len(history) == 2
+    assert history[0]["activation_result"] == result
+    assert history[0]["context_snapshot"] == "none"
+    assert history[1]["transformation"]["from"] == "Λ"
+    assert history[1]["transformation"]["to"] == transformed.type == "Σ"
+
+    # История только для чтения: пополняется жестами, а не снаружи
+    with pytest.raises(AttributeError):
+        history.append({})
+    print("✅ История трансформаций связи корректна.")
+
+
+def test_absolutism_keyword_with_punctuation():
+    """Тест: ключевое слово рядом с пунктуацией распознаётся."""
+    from core.axiom import OntologicalAxioms
+    with pytest.raises(OntologicalLimitError):
+        OntologicalAxioms.validate_no_absolutism("Так будет никогда.")
+    with pytest.raises(OntologicalLimitError):
+        OntologicalAxioms.validate_no_absolutism('(Α "никогда")')
+    print("✅ Абсолютизм у знаков препинания распознан.")
+
+
+def test_absolutism_keyword_case_insensitive():
+    """Тест: проверка абсолютизма не зависит от регистра."""
+    from core.axiom import OntologicalAxioms
+    with pytest.raises(OntologicalLimitError):
+        OntologicalAxioms.validate_no_absolutism("ВСЕГДА так")
+    print("✅ Абсолютизм распознан в любом регистре.")
+
+
+def test_absolutism_ignores_longer_words():
+    """Тест: слово, содержащее ключевое слово, не считается абсолютизмом."""
+    from core.axiom import OntologicalAxioms
+    OntologicalAxioms.validate_no_absolutism("всегдашний спор")
+    print("✅ Производные слова не отклоняются.")
+
+
 if __name__ == "__main__":
     # Позволяет запускать тесты напрямую
     test_lexer_extracts_phi_meta()
@@ -126,6 +185,11 @@ if __name__ == "__main__":
     test_evaluator_creates_relation()
     test_context_tracks_coherence()
     test_axiom_limits_entities()
+    test_fair_care_metadata_not_shared()
+    test_relation_transformation_history()
+    test_absolutism_keyword_with_punctuation()
+    test_absolutism_keyword_case_insensitive()
+    test_absolutism_ignores_longer_words()
     print("\n🎉 Все базовые тесты пройдены!")
     
 """
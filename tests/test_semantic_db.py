@@ -190,6 +190,160 @@ def test_semantic_db_multi_format_export():
                 os.remove(path)
 
 
+def test_semantic_db_relations_columnar():
+    """Тест: связи экспортируются столбцами одинаковой длины."""
+    evaluator = SyntheticOntologicalEvaluator("тест_столбцы")
+    evaluator.eval(['Α', 'источник'])
+    evaluator.eval(['Α', 'цель'])
+    evaluator.eval(['Λ', 'источник', 'цель'])
+
+    serializer = SemanticDBSerializer(evaluator.context)
+    relations = serializer._serialize_relations()
+
+    lengths = {len(column) for column in relations.values()}
+    assert lengths == {evaluator.context.graph.number_of_edges()}
+    records = list(zip(relations['sources'], relations['targets'], relations['types']))
+    assert ('источник', 'цель', 'Λ') in records
+    print("✅ Связи экспортированы столбцами.")
+
+
+def test_semantic_db_export_sees_relation_activation():
+    """Тест: повторный экспорт тем же сериализатором видит активацию связи."""
+    evaluator = SyntheticOntologicalEvaluator("тест_активация")
+    evaluator.eval(['Α', 'источник'])
+    evaluator.eval(['Α', 'цель'])
+    evaluator.eval(['Λ', 'источник', 'цель'])
+
+    cycle_data = {
+        'cycle_id': 'activation_test',
+        'timestamp': '2026-01-06T00:00:00Z',
+        'expressions_evaluated': 3,
+        'final_coherence': 1.0,
+        'phi_dialogues_count': 0
+    }
+    serializer = evaluator.semantic_db
+    serializer.to_yaml(cycle_data)
+    serializer.to_graphml(cycle_data)
+
+    relation = evaluator.context.graph['источник']['цель']['relation']
+    for _ in range(5):
+        relation.activate()
+
+    content = yaml.safe_load(serializer.to_yaml(cycle_data))
+    assert content['ontological_context']['relations']['certainties'] == [relation.certainty]
+    assert f'<data key="certainty">{relation.certainty}</data>' in serializer.to_graphml(cycle_data)
+    print("✅ Экспорт отражает активацию связи.")
+
+
+def test_semantic_db_json_ld_documents_isolated():
+    """Тест: правка возвращённого JSON-LD документа не влияет на следующие экспорты."""
+    evaluator = SyntheticOntologicalEvaluator("тест_изоляция")
+    evaluator.eval(['Α', 'изолированная_сущность'])
+
+    cycle_data = {
+        'cycle_id': 'isolation_test',
+        'timestamp': '2026-01-06T00:00:00Z',
+        'expressions_evaluated': 1,
+        'final_coherence': 1.0,
+        'phi_dialogues_count': 0
+    }
+    serializer = evaluator.semantic_db
+    document = serializer.to_json_ld(cycle_data)
+    document['@context']['logos'] = 'изменено'
+    document['logos:events'][-1]['gesture'] = 'изменено'
+    document['logos:events'][-1]['metadata']['license'] = 'изменено'
+
+    assert 'изменено' not in json.dumps(serializer.to_json_ld(cycle_data), ensure_ascii=False)
+    assert 'изменено' not in serializer.to_yaml(cycle_data)
+    print("✅ JSON-LD документы изолированы между экспортами.")
+
+
+def test_semantic_db_turtle_blind_spots():
+    """Тест: Turtle остаётся корректным при кавычках и без слепых пятен."""
+    import rdflib
+
+    evaluator = SyntheticOntologicalEvaluator("тест_turtle")
+    evaluator.context.register_blind_spot('пятно "в кавычках"', "проверка экранирования")
+
+    cycle_data = {
+        'cycle_id': 'turtle_test',
+        'timestamp': '2026-01-06T00:00:00Z',
+        'expressions_evaluated': 0,
+        'final_coherence': 1.0,
+        'phi_dialogues_count': 0
+    }
+    serializer = SemanticDBSerializer(evaluator.context)
+
+    graph = rdflib.Graph().parse(data=serializer.to_turtle(cycle_data), format='turtle')
+    spots = {str(o) for o in graph.objects(predicate=rdflib.URIRef(
+        "https://a-universum.com/logos-ontology#hasBlindSpot"))}
+    assert 'пятно "в кавычках"' in spots
+
+    evaluator.context.blind_spots.clear()
+    graph = rdflib.Graph().parse(data=serializer.to_turtle(cycle_data), format='turtle')
+    assert len(graph) > 0
+    print("✅ Turtle корректен для любых слепых пятен.")
+
+
+def test_semantic_db_empty_sections_omitted():
+    """Тест: пустые разделы не попадают в отчёт, слепые пятна — всегда."""
+    evaluator = SyntheticOntologicalEvaluator("тест_пустые_разделы")
+
+    cycle_data = {
+        'cycle_id': 'empty_sections_test',
+        'timestamp': '2026-01-06T00:00:00Z',
+        'expressions_evaluated': 0,
+        'final_coherence': 1.0,
+        'phi_dialogues_count': 0
+    }
+    serializer = SemanticDBSerializer(evaluator.context)
+
+    content = yaml.safe_load(serializer.to_yaml(cycle_data))
+    assert 'phi_dialogues' not in content
+    assert 'tensions' not in content['ontological_context']
+    assert 'blind_spots' in content['ontological_context']
+    assert 'habeas_weights' in content['ontological_context']
+
+    document = serializer.to_json_ld(cycle_data)
+    assert 'logos:phiDialogues' not in document
+    assert 'logos:blindSpots' in document
+    print("✅ Пустые разделы пропущены.")
+
+
+def test_semantic_db_zstd_export():
+    """Тест: экспорт с суффиксом .zst распаковывается в тот же документ."""
+    zstandard = pytest.importorskip("zstandard")
+    evaluator = SyntheticOntologicalEvaluator("тест_zstd")
+    evaluator.eval(['Α', 'сжатая_сущность'])
+
+    cycle_data = {
+        'cycle_id': 'zstd_test',
+        'timestamp': '2026-01-06T00:00:00Z',
+        'expressions_evaluated': 1,
+        'final_coherence': evaluator.context._dynamic_coherence(),
+        'phi_dialogues_count': 0
+    }
+    serializer = SemanticDBSerializer(evaluator.context)
+    path = Path("test_zstd.graphml.zst")
+    # Неизвестный внутренний суффикс заменяется на YAML, как и без сжатия
+    fallback_path = Path("test_zstd.yaml.zst")
+
+    try:
+        serializer.export_cycle(cycle_data, str(path))
+        with path.open('rb') as f:
+            content = zstandard.ZstdDecompressor().stream_reader(f).read().decode('utf-8')
+        assert content == serializer.to_graphml(cycle_data) + "\n"
+
+        serializer.export_cycle(cycle_data, "test_zstd.txt.zst")
+        assert fallback_path.exists()
+        assert not Path("test_zstd.txt.yaml.zst").exists()
+        print("✅ Сжатый экспорт корректен.")
+    finally:
+        for p in (path, fallback_path):
+            if p.exists():
+                p.unlink()
+
+
 def test_semantic_db_validation_failure():
     """Тест: валидатор корректно отклоняет некорректные данные."""
     evaluator = SyntheticOntologicalEvaluator("тест_валидация")
@@ -219,6 +373,12 @@ if __name__ == "__main__":
     test_semantic_db_habeas_weights_inclusion()
     test_semantic_db_blind_spots_recognition()
     test_semantic_db_multi_format_export()
+    test_semantic_db_relations_columnar()
+    test_semantic_db_export_sees_relation_activation()
+    test_semantic_db_json_ld_documents_isolated()
+    test_semantic_db_turtle_blind_spots()
+    test_semantic_db_empty_sections_omitted()
+    test_semantic_db_zstd_export()
     test_semantic_db_validation_failure()
     print("\n🎉 Все тесты SemanticDB пройдены!")
     